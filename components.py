@@ -3,48 +3,80 @@ Core game logic for Minesweeper.
 
 This module contains pure domain logic without any pygame or pixel-level
 concerns. It defines:
-- CellState: the state of a single cell
-- Cell: a cell positioned by (col,row) with an attached CellState
 - Board: grid management, mine placement, adjacency computation, reveal/flag
+  with per-cell state kept in parallel NumPy arrays
 
 The Board exposes imperative methods that the presentation layer (run.py)
 can call in response to user inputs, and does not know anything about
 rendering, timing, or input devices.
 """
 
-import random
 from typing import List, Tuple
 
+import numpy as np
 
-class CellState:
-    """Mutable state of a single cell.
+try:
+    from numba import njit
+except ImportError:  # numba가 없으면 같은 코드를 순수 Python으로 실행
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
-    Attributes:
-        is_mine: Whether this cell contains a mine.
-        is_revealed: Whether the cell has been revealed to the player.
-        is_flagged: Whether the player flagged this cell as a mine.
-        adjacent: Number of adjacent mines in the 8 neighboring cells.
-    """
+# 지뢰 배치용 난수 생성기
+_rng = np.random.default_rng()
 
-    def __init__(self, is_mine: bool = False, is_revealed: bool = False, is_flagged: bool = False, adjacent: int = 0):
-        self.is_mine = is_mine
-        self.is_revealed = is_revealed
-        self.is_flagged = is_flagged
-        self.adjacent = adjacent
+# 주변 8방향 (dc, dr) 오프셋
+_DELTAS = (
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0),           (1, 0),
+    (-1, 1),  (0, 1),  (1, 1),
+)
 
 
-class Cell:
-    """Logical cell positioned on the board by column and row."""
+@njit(cache=True, boundscheck=False)
+def _flood(is_revealed, is_flagged, adjacent, col, row) -> int:
+    """Reveal (col,row) and flood through zero-adjacent cells.
 
-    def __init__(self, col: int, row: int):
-        self.col = col
-        self.row = row
-        self.state = CellState()
+    Works directly on the board arrays with a fixed-size stack of flat
+    indices so it can be JIT-compiled by numba when available. Cells are
+    marked revealed when pushed, so each cell enters the stack at most once.
+    Returns the number of newly revealed cells.
+    """
+    rows, cols = is_revealed.shape
+    stack = np.empty(rows * cols, dtype=np.int32)
+    is_revealed[row, col] = True
+    stack[0] = row * cols + col
+    top = 1
+    count = 1
+    while top > 0:
+        top -= 1
+        r = stack[top] // cols
+        c = stack[top] % cols
+        if adjacent[r, c] != 0:
+            continue
+        for dr in range(-1, 2):
+            for dc in range(-1, 2):
+                nr = r + dr
+                nc = c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and not is_revealed[nr, nc] and not is_flagged[nr, nc]:
+                    is_revealed[nr, nc] = True
+                    stack[top] = nr * cols + nc
+                    top += 1
+                    count += 1
+    return count
 
 
 class Board:
     """Minesweeper board state and rules.
 
+    Cell state is stored as parallel NumPy arrays shaped (rows, cols) and
+    indexed as [row, col]:
+    - is_mine: whether the cell contains a mine
+    - is_revealed: whether the cell has been revealed to the player
+    - is_flagged: whether the player flagged the cell as a mine
+    - adjacent: number of mines in the 8 neighboring cells
+
     Responsibilities:
     - Generate and place mines with first-click safety
     - Compute adjacency counts for every cell
@@ -56,9 +88,13 @@ class Board:
         self.cols = cols
         self.rows = rows
         self.num_mines = mines
-        self.cells: List[Cell] = [Cell(c, r) for r in range(rows) for c in range(cols)]
+        self.is_mine = np.zeros((rows, cols), dtype=np.bool_)
+        self.is_revealed = np.zeros((rows, cols), dtype=np.bool_)
+        self.is_flagged = np.zeros((rows, cols), dtype=np.bool_)
+        self.adjacent = np.zeros((rows, cols), dtype=np.int8)
         self._mines_placed = False
         self.revealed_count = 0
+        self.flag_count = 0
         self.game_over = False
         self.win = False
 
@@ -72,116 +108,94 @@ class Board:
 
     def neighbors(self, col: int, row: int) -> List[Tuple[int, int]]:
         # TODO: Return list of valid neighboring coordinates around (col,row).
-        deltas = [
-            (-1, -1), (0, -1), (1, -1),
-            (-1, 0),            (1, 0),
-            (-1, 1),  (0, 1),  (1, 1),
+        # 테두리에 닿지 않는 내부 셀은 범위 체크 없이 8방향 모두 반환
+        cols, rows = self.cols, self.rows
+        if 0 < col < cols - 1 and 0 < row < rows - 1:
+            return [(col + dc, row + dr) for dc, dr in _DELTAS]
+        return [
+            (col + dc, row + dr)
+            for dc, dr in _DELTAS
+            if 0 <= col + dc < cols and 0 <= row + dr < rows
         ]
-        result = []
-        for c,r in deltas:
-            n_c = col + c 
-            n_r = row + r
-            # 범위 체크
-            if self.is_inbounds(n_c,n_r):
-                result.append((n_c,n_r))
-        return result
 
     def place_mines(self, safe_col: int, safe_row: int) -> None:
         # TODO: Place mines randomly, guaranteeing the first click and its neighbors are safe. And Compute adjacency counts
-        # 지뢰 배치 좌표 목록
-        all_positions = [(c, r) for r in range(self.rows) for c in range(self.cols)]
-        # 맨 처음 클릭한 셸의 좌표와 이웃 셸을 금지 구역 설정
-        forbidden = {(safe_col, safe_row)} | set(self.neighbors(safe_col, safe_row))
-        # 그 외 지뢰를 둘 수 있는 셸 리스트
-        pool = [p for p in all_positions if p not in forbidden]
-        random.shuffle(pool)
-
-        # 지뢰 둘 위치 선택
-        mine_positions = pool[:self.num_mines]
-        
+        # 맨 처음 클릭한 셸의 좌표와 이웃 셸을 금지 구역 설정 (3x3 슬라이스, 경계는 잘림)
+        forbidden = np.zeros((self.rows, self.cols), dtype=np.bool_)
+        forbidden[max(0, safe_row - 1):safe_row + 2, max(0, safe_col - 1):safe_col + 2] = True
+        # 그 외 지뢰를 둘 수 있는 셸의 flat 인덱스
+        candidates = np.flatnonzero(~forbidden)
+
+        # 지뢰 둘 위치 선택 (전체 셔플 없이 필요한 개수만 비복원 추출)
+        chosen = _rng.choice(candidates, min(self.num_mines, candidates.size), replace=False)
+
         # 지뢰 적용
-        for c, r in mine_positions:
-            self.cells[self.index(c, r)].state.is_mine = True
-       
+        self.is_mine.flat[chosen] = True
+
        # Compute adjacency counts ( 인접한 지뢰 수 계산 )
-        for r in range(self.rows):
-            for c in range(self.cols):
-                cell = self.cells[self.index(c,r)] # cell 객체 반환
-                
-                 # 지뢰가 아닌 셀에 대해서만 계산
-                if not cell.state.is_mine:
-                    mine_count = 0
-                    # 주변 8칸 순회
-                    for nc, nr in self.neighbors(c, r):
-                        # 이웃 셀이 지뢰인지 확인
-                        if self.cells[self.index(nc, nr)].state.is_mine:
-                            mine_count += 1
-                    cell.state.adjacent = mine_count
+        # 테두리를 0으로 패딩한 뒤 주변 8방향 슬라이스를 더해 한 번에 계산
+        padded = np.pad(self.is_mine.astype(np.int8), 1)
+        adjacent = (
+            padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:]
+            + padded[1:-1, :-2]                  + padded[1:-1, 2:]
+            + padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:]
+        )
+        # 지뢰가 아닌 셀에 대해서만 계산
+        adjacent[self.is_mine] = 0
+        self.adjacent = adjacent
         
         self._mines_placed = True
 
     def reveal(self, col: int, row: int) -> None:
         # TODO: Reveal a cell; if zero-adjacent, iteratively flood to neighbors.
-        if not self.is_inbounds(col, row):
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
             return
         
         if not self._mines_placed:
             self.place_mines(col, row)
         
-        cell = self.cells[self.index(col,row)]
-        
         # 오픈되어 잇거나 깃발 둔 상태 처리
-        if cell.state.is_revealed or cell.state.is_flagged:
+        if self.is_revealed[row, col] or self.is_flagged[row, col]:
             return
         
-        cell.state.is_revealed=True
-        self.revealed_count+=1
-
         # 지뢰이면
-        if cell.state.is_mine:
-            self.game_over=True
+        if self.is_mine[row, col]:
+            self.is_revealed[row, col] = True
+            self.revealed_count += 1
+            self.game_over = True
             self._reveal_all_mines()
             return
-                # 5. 연쇄 개방 (Flood Fill): 인접 지뢰가 0개라면 주변 셀을 재귀적으로 오픈
-        if cell.state.adjacent == 0:
-            for nc, nr in self.neighbors(col, row):
-                self.reveal(nc, nr) # 재귀 호출
+
+        # 연쇄 개방 (Flood Fill): 인접 지뢰가 0개인 영역을 한 번에 오픈
+        self.revealed_count += _flood(self.is_revealed, self.is_flagged, self.adjacent, col, row)
 
         self._check_win()
 
     def toggle_flag(self, col: int, row: int) -> None:
         # TODO: Toggle a flag on a non-revealed cell.
-        if not self.is_inbounds(col, row):
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
             return
         
-        cell = self.cells[self.index(col,row)]
-        if cell.state.is_revealed:
+        if self.is_revealed[row, col]:
             return
 
         # 플래그 토글
-        cell.state.is_flagged = not cell.state.is_flagged
+        self.is_flagged[row, col] = not self.is_flagged[row, col]
+        self.flag_count += 1 if self.is_flagged[row, col] else -1
         
         self._check_win()
 
     def flagged_count(self) -> int:
         # TODO: Return current number of flagged cells.
-        count = 0
-        for cell in self.cells:
-               if cell.state.is_flagged:
-                count+=1
-        return count
+        return self.flag_count
 
     def _reveal_all_mines(self) -> None:
         """Reveal all mines; called on game over."""
-        for cell in self.cells:
-            if cell.state.is_mine:
-                cell.state.is_revealed = True
+        self.is_revealed |= self.is_mine
 
     def _check_win(self) -> None:
         """Set win=True when all non-mine cells have been revealed."""
         total_cells = self.cols * self.rows
         if self.revealed_count == total_cells - self.num_mines and not self.game_over:
             self.win = True
-            for cell in self.cells:
-                if not cell.state.is_revealed and not cell.state.is_mine:
-                    cell.state.is_revealed = True
+            self.is_revealed |= ~self.is_mine
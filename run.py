@@ -11,6 +11,7 @@ The logic lives in components.Board; this module should not implement rules.
 
 import sys
 
+import numpy as np
 import pygame
 
 import config
@@ -22,7 +23,8 @@ class Renderer:
     """Draws the Minesweeper UI.
 
     Knows how to draw individual cells with flags/numbers, header info,
-    and end-of-game overlays with a semi-transparent background.
+    and end-of-game overlays with a semi-transparent background. The grid
+    is kept on a cached surface where only cells that changed are repainted.
     """
 
     def __init__(self, screen: pygame.Surface, board: Board):
@@ -31,70 +33,145 @@ class Renderer:
         self.font = pygame.font.Font(config.font_name, config.font_size)
         self.header_font = pygame.font.Font(config.font_name, config.header_font_size)
         self.result_font = pygame.font.Font(config.font_name, config.result_font_size)
+        # 숫자와 깃발은 내용이 고정이므로 한 번만 렌더링해 두고 blit만 한다
+        self._num_surfs = {
+            n: self.font.render(str(n), True, config.number_colors.get(n, config.color_text))
+            for n in range(1, 9)
+        }
+        self._flag_surf = self._render_flag()
+        # 강조 셀은 기본 셀을 그린 뒤 이 타일을 덮어씌우는 후처리로만 그린다
+        self._highlight_tile = pygame.Surface((config.cell_size, config.cell_size))
+        self._highlight_tile.fill(config.color_highlight)
+        pygame.draw.rect(self._highlight_tile, config.color_grid, self._highlight_tile.get_rect(), 1)
+        self._header_rect = Rect(0, 0, config.width, config.margin_top - 4)
+        # 헤더 슬롯별 (문구, 렌더링 결과); 문구가 바뀔 때만 다시 렌더링
+        self._header_labels = {}
+        # 결과 화면용 반투명 배경과 결과 문구는 한 번 만들어 재사용
+        self._overlay_surf = pygame.Surface((config.width, config.height), pygame.SRCALPHA)
+        self._overlay_surf.fill((0, 0, 0, config.result_overlay_alpha))
+        self._result_labels = {}
+        self.set_board(board)
+
+    def _render_flag(self) -> pygame.Surface:
+        """Render the flag shape once onto a transparent cell-sized surface."""
+        size = config.cell_size
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        flag_w = max(6, size // 3)
+        flag_h = max(8, size // 2)
+        pole_x = size // 3
+        pole_y = 4
+        pygame.draw.line(surf, config.color_flag, (pole_x, pole_y), (pole_x, pole_y + flag_h), 2)
+        pygame.draw.polygon(
+            surf,
+            config.color_flag,
+            [
+                (pole_x + 2, pole_y),
+                (pole_x + 2 + flag_w, pole_y + flag_h // 3),
+                (pole_x + 2, pole_y + flag_h // 2),
+            ],
+        )
+        return surf
+
+    def set_board(self, board: Board) -> None:
+        """Attach a (new) board and repaint the cached board surface from scratch."""
+        self.board = board
+        self._board_surface = pygame.Surface((board.cols * config.cell_size, board.rows * config.cell_size))
+        # 셀 Rect는 보드 크기가 바뀔 때만 다시 만들고 매 프레임 재사용한다
+        size = config.cell_size
+        self._rects = [
+            [Rect(config.margin_left + c * size, config.margin_top + r * size, size, size) for c in range(board.cols)]
+            for r in range(board.rows)
+        ]
+        self._board_rects = [
+            [Rect(c * size, r * size, size, size) for c in range(board.cols)]
+            for r in range(board.rows)
+        ]
+        # 마지막으로 그린 상태의 스냅샷; draw_board에서 현재 상태와 비교해 바뀐 셀만 다시 그린다
+        self._shown_revealed = board.is_revealed.copy()
+        self._shown_flagged = board.is_flagged.copy()
+        paint, surface, rects = self._paint_cell, self._board_surface, self._board_rects
+        for r in range(board.rows):
+            for c in range(board.cols):
+                paint(surface, rects[r][c], c, r)
 
     def cell_rect(self, col: int, row: int) -> Rect:
-        """Return the rectangle in pixels for the given grid cell."""
-        x = config.margin_left + col * config.cell_size
-        y = config.margin_top + row * config.cell_size
-        return Rect(x, y, config.cell_size, config.cell_size)
-
-    def draw_cell(self, col: int, row: int, highlighted: bool) -> None:
-        """Draw a single cell, respecting revealed/flagged state and highlight."""
-        cell = self.board.cells[self.board.index(col, row)]
-        rect = self.cell_rect(col, row)
-        if cell.state.is_revealed:
-            pygame.draw.rect(self.screen, config.color_cell_revealed, rect)
-            if cell.state.is_mine:
-                pygame.draw.circle(self.screen, config.color_cell_mine, rect.center, rect.width // 4)
-            elif cell.state.adjacent > 0:
-                color = config.number_colors.get(cell.state.adjacent, config.color_text)
-                label = self.font.render(str(cell.state.adjacent), True, color)
-                label_rect = label.get_rect(center=rect.center)
-                self.screen.blit(label, label_rect)
+        """Return the (shared, do not mutate) rectangle in pixels for the given grid cell."""
+        return self._rects[row][col]
+
+    def board_cell_rect(self, col: int, row: int) -> Rect:
+        """Return the (shared, do not mutate) rectangle of the given grid cell inside the cached board surface."""
+        return self._board_rects[row][col]
+
+    def draw_board(self) -> None:
+        """Repaint cells whose state changed since the last frame, then blit the board."""
+        board = self.board
+        changed = (board.is_revealed != self._shown_revealed) | (board.is_flagged != self._shown_flagged)
+        if changed.any():
+            paint, surface, rects = self._paint_cell, self._board_surface, self._board_rects
+            for r, c in np.argwhere(changed).tolist():
+                paint(surface, rects[r][c], c, r)
+            np.copyto(self._shown_revealed, board.is_revealed)
+            np.copyto(self._shown_flagged, board.is_flagged)
+        self.screen.blit(self._board_surface, (config.margin_left, config.margin_top))
+
+    def draw_grid(self, now: int, highlight_targets: set, highlight_until_ms: int) -> None:
+        """Draw the cached board, then any cells still highlighted at tick now."""
+        self.draw_board()
+        # 전체 셀을 돌지 않고 강조 대상(최대 8칸)만 위에 덧그린다
+        if now <= highlight_until_ms:
+            board = self.board
+            for c, r in highlight_targets:
+                if board.is_revealed[r, c]:
+                    continue
+                rect = self.cell_rect(c, r)
+                self.screen.blit(self._highlight_tile, rect)
+                if board.is_flagged[r, c]:
+                    self.screen.blit(self._flag_surf, rect)
+
+    def _paint_cell(self, surface: pygame.Surface, rect: Rect, col: int, row: int) -> None:
+        """Paint the base look of a single cell into surface at rect, respecting revealed/flagged state."""
+        board = self.board
+        if board.is_revealed[row, col]:
+            pygame.draw.rect(surface, config.color_cell_revealed, rect)
+            adjacent = int(board.adjacent[row, col])
+            if board.is_mine[row, col]:
+                pygame.draw.circle(surface, config.color_cell_mine, rect.center, rect.width // 4)
+            elif adjacent > 0:
+                label = self._num_surfs[adjacent]
+                surface.blit(label, label.get_rect(center=rect.center))
         else:
-            base_color = config.color_highlight if highlighted else config.color_cell_hidden
-            pygame.draw.rect(self.screen, base_color, rect)
-            if cell.state.is_flagged:
-                flag_w = max(6, rect.width // 3)
-                flag_h = max(8, rect.height // 2)
-                pole_x = rect.left + rect.width // 3
-                pole_y = rect.top + 4
-                pygame.draw.line(self.screen, config.color_flag, (pole_x, pole_y), (pole_x, pole_y + flag_h), 2)
-                pygame.draw.polygon(
-                    self.screen,
-                    config.color_flag,
-                    [
-                        (pole_x + 2, pole_y),
-                        (pole_x + 2 + flag_w, pole_y + flag_h // 3),
-                        (pole_x + 2, pole_y + flag_h // 2),
-                    ],
-                )
-        pygame.draw.rect(self.screen, config.color_grid, rect, 1)
+            pygame.draw.rect(surface, config.color_cell_hidden, rect)
+            if board.is_flagged[row, col]:
+                surface.blit(self._flag_surf, rect)
+        pygame.draw.rect(surface, config.color_grid, rect, 1)
 
     def draw_header(self, remaining_mines: int, time_text: str) -> None:
         """Draw the header bar containing remaining mines and elapsed time."""
-        pygame.draw.rect(
-            self.screen,
-            config.color_header,
-            Rect(0, 0, config.width, config.margin_top - 4),
-        )
-        left_text = f"Mines: {remaining_mines}"
-        right_text = f"Time: {time_text}"
-        left_label = self.header_font.render(left_text, True, config.color_header_text)
-        right_label = self.header_font.render(right_text, True, config.color_header_text)
+        pygame.draw.rect(self.screen, config.color_header, self._header_rect)
+        left_label = self._header_label("left", f"Mines: {remaining_mines}")
+        right_label = self._header_label("right", f"Time: {time_text}")
         self.screen.blit(left_label, (10, 12))
         self.screen.blit(right_label, (config.width - right_label.get_width() - 10, 12))
 
+    def _header_label(self, slot: str, text: str) -> pygame.Surface:
+        """Return the rendered label for a header slot, re-rendering only when its text changes."""
+        cached = self._header_labels.get(slot)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        label = self.header_font.render(text, True, config.color_header_text)
+        self._header_labels[slot] = (text, label)
+        return label
+
     def draw_result_overlay(self, text: str | None) -> None:
         """Draw a semi-transparent overlay with centered result text, if any."""
         if not text:
             return
-        overlay = pygame.Surface((config.width, config.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, config.result_overlay_alpha))
-        self.screen.blit(overlay, (0, 0))
-        label = self.result_font.render(text, True, config.color_result)
-        rect = label.get_rect(center=(config.width // 2, config.height // 2))
-        self.screen.blit(label, rect)
+        label = self._result_labels.get(text)
+        if label is None:
+            label = self.result_font.render(text, True, config.color_result)
+            self._result_labels[text] = label
+        self.screen.blit(self._overlay_surf, (0, 0))
+        self.screen.blit(label, label.get_rect(center=(config.width // 2, config.height // 2)))
 
 
 class InputController:
@@ -120,32 +197,44 @@ class InputController:
         col, row = self.pos_to_grid(pos[0], pos[1])
         if col == -1:
             return
+        handler = self._HANDLERS.get(button)
+        if handler is not None:
+            handler(self, col, row)
+
+    def _do_reveal(self, col: int, row: int) -> None:
+        """Left click: start the timer on the first click and reveal the cell."""
         game = self.game
-        
-        # 좌클릭(1)
-        if button == config.mouse_left:
-            game.highlight_targets.clear()
-
-        # 게임이 시작 x      
-            if not game.started:
-                game.started = True
-                game.start_ticks_ms = pygame.time.get_ticks()
-            game.board.reveal(col, row) # reveal 호출
-        
-        # 우클릭(3)
-        elif button == config.mouse_right:
-            game.highlight_targets.clear()
-            game.board.toggle_flag(col, row) # 플래그 on/off
-        
-        # 휠(2)
-        elif button == config.mouse_middle:
-                neighbors = game.board.neighbors(col,row)
-                game.highlight_targets = {
-                    # 공개된 셸 여부 확인
-                    (nc, nr) for (nc, nr) in neighbors if not game.board.cells[game.board.index(nc, nr)].state.is_revealed
-                }
-        
-                game.highlight_until_ms = pygame.time.get_ticks() + config.highlight_duration_ms
+        game.highlight_targets.clear()
+        # 게임이 시작 x
+        if not game.started:
+            game.started = True
+            game.start_ticks_ms = pygame.time.get_ticks()
+        game.board.reveal(col, row) # reveal 호출
+
+    def _do_flag(self, col: int, row: int) -> None:
+        """Right click: toggle a flag on the cell."""
+        game = self.game
+        game.highlight_targets.clear()
+        game.board.toggle_flag(col, row) # 플래그 on/off
+
+    def _do_highlight(self, col: int, row: int) -> None:
+        """Middle click: briefly highlight the unrevealed neighbors of the cell."""
+        game = self.game
+        is_revealed = game.board.is_revealed
+        neighbors = game.board.neighbors(col, row)
+        game.highlight_targets = {
+            # 공개된 셸 여부 확인
+            (nc, nr) for (nc, nr) in neighbors if not is_revealed[nr, nc]
+        }
+        game.highlight_until_ms = pygame.time.get_ticks() + config.highlight_duration_ms
+
+    # 마우스 버튼 -> 처리 메서드 (좌클릭(1), 휠(2), 우클릭(3))
+    _HANDLERS = {
+        config.mouse_left: _do_reveal,
+        config.mouse_middle: _do_highlight,
+        config.mouse_right: _do_flag,
+    }
+
 
 class Game:
     """Main application object orchestrating loop and high-level state."""
@@ -163,24 +252,26 @@ class Game:
         self.started = False
         self.start_ticks_ms = 0
         self.end_ticks_ms = 0
+        self._frame_dirty = True
+        self._last_frame_key = None
 
     def reset(self):
         """Reset the game state and start a new board."""
         self.board = Board(config.cols, config.rows, config.num_mines)
-        self.renderer.board = self.board
+        self.renderer.set_board(self.board)
         self.highlight_targets.clear()
         self.highlight_until_ms = 0
         self.started = False
         self.start_ticks_ms = 0
         self.end_ticks_ms = 0
 
-    def _elapsed_ms(self) -> int:
-        """Return elapsed time in milliseconds (stops when game ends)."""
+    def _elapsed_ms(self, now: int) -> int:
+        """Return elapsed time in milliseconds at tick now (stops when game ends)."""
         if not self.started:
             return 0
         if self.end_ticks_ms:
             return self.end_ticks_ms - self.start_ticks_ms
-        return pygame.time.get_ticks() - self.start_ticks_ms
+        return now - self.start_ticks_ms
 
     def _format_time(self, ms: int) -> str:
         """Format milliseconds as mm:ss string."""
@@ -198,26 +289,37 @@ class Game:
         return None
 
     def draw(self):
-        """Render one frame: header, grid, result overlay."""
-        if pygame.time.get_ticks() > self.highlight_until_ms and self.highlight_targets:
+        """Render one frame: header, grid, result overlay.
+
+        Skipped when no input arrived since the last frame and the header,
+        result and highlight state are unchanged, since the display surface
+        still holds that frame.
+        """
+        now = pygame.time.get_ticks()
+        if now > self.highlight_until_ms and self.highlight_targets:
             self.highlight_targets.clear()
-        self.screen.fill(config.color_bg)
         remaining = max(0, config.num_mines - self.board.flagged_count())
-        time_text = self._format_time(self._elapsed_ms())
+        time_text = self._format_time(self._elapsed_ms(now))
+        result_text = self._result_text()
+        # 입력이 없었고 화면에 보이는 값도 그대로면 이전 프레임을 그대로 둔다
+        frame_key = (remaining, time_text, result_text, bool(self.highlight_targets))
+        if not self._frame_dirty and frame_key == self._last_frame_key:
+            return
+        self.screen.fill(config.color_bg)
         self.renderer.draw_header(remaining, time_text)
-        now = pygame.time.get_ticks()
-        for r in range(self.board.rows):
-            for c in range(self.board.cols):
-                highlighted = (now <= self.highlight_until_ms) and ((c, r) in self.highlight_targets)
-                self.renderer.draw_cell(c, r, highlighted)
-        self.renderer.draw_result_overlay(self._result_text())
+        self.renderer.draw_grid(now, self.highlight_targets, self.highlight_until_ms)
+        self.renderer.draw_result_overlay(result_text)
         pygame.display.flip()
+        self._frame_dirty = False
+        self._last_frame_key = frame_key
 
     def run_step(self) -> bool:
         """Process inputs, update time, draw, and tick the clock once."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED):
+                self._frame_dirty = True
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
                     self.reset()